@@ -23,26 +23,26 @@ class Dispatcher:
         """
         self.default_function = default_function
         self.registry: Dict[Any, Callable[..., Any]] = {}
+        # bound once so that dispatching skips the attribute lookups
+        self._get = self.registry.get
+        self._default = default_function
         self.__doc__ = default_function.__doc__
         self.__name__ = default_function.__name__
        
 
-    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+    def __call__(self, key: Any, *args: Any, **kwargs: Any) -> Any:
         """
         Dispatch to the appropriate function based on the first argument.
         
         Args:
-            *args: Positional arguments to pass to the selected function.
+            key (Any): The first positional argument, used to select the function.
+            *args: Remaining positional arguments to pass to the selected function.
             **kwargs: Keyword arguments to pass to the selected function.
         
         Returns:
             The result of the dispatched function.
         """
-        if not args:
-            raise ValueError("At least one positional argument is required for dispatching.")
-        key = args[0]
-        function_to_call = self.registry.get(key, self.default_function)
-        return function_to_call(*args, **kwargs)
+        return (self._get(key) or self._default)(key, *args, **kwargs)
 
     def register(self, key: Any) -> Callable[[Callable[..., T]], Callable[..., T]]:
         """
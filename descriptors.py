@@ -2,12 +2,29 @@
 import weakref
 import json
 from decorators import Dispatcher
-from collections import defaultdict
-from types import MappingProxyType
+from types import MappingProxyType, MemberDescriptorType
 from numbers import Real
+from math import isfinite
 from datetime import date, datetime
+from functools import lru_cache
 
-__all__ = ['validate', 'TypeChecker']
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for column validation
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is only needed to compile validate_batch
+    njit = None
+    prange = range
+
+try:
+    import orjson
+except ImportError:  # fall back to the standard library json
+    orjson = None
+
+__all__ = ['validate', 'specialize', 'column_mask', 'validate_batch', 'TypeChecker']
 
 class ValidationError(ValueError):
     """
@@ -16,9 +33,9 @@ class ValidationError(ValueError):
     Attributes:
         field_name (str): The name of the field where the validation error occurred.
         error_message (str): A descriptive error message indicating the validation issue.
-        all (defaultdict): A class-level attribute that maps field names to lists of error messages.
+        all (list): A class-level log of (field name, error message) records, in the order they occurred.
     """
-    all = defaultdict(list)
+    all = []
 
     def __init__(self, field_name: str, error_message: str):
         """
@@ -41,7 +58,21 @@ class ValidationError(ValueError):
         Returns:
             MappingProxy: A read-only dictionary mapping field names to their respective error messages.
         """
-        return MappingProxyType(cls.all)
+        errors = {}
+        for field_name, message in cls.all:
+            errors.setdefault(field_name, []).append(message)
+        return MappingProxyType(errors)
+
+    @classmethod
+    def get_errors_as_exceptions(cls):
+        """
+        Build ValidationError instances from the logged error messages.
+
+        Returns:
+            dict: A dictionary mapping field names to lists of ValidationError instances.
+        """
+        return {field_name: [cls(field_name, message) for message in messages]
+                for field_name, messages in cls.get_errors().items()}
 
     @classmethod
     def clear_errors(cls):
@@ -53,12 +84,17 @@ class ValidationError(ValueError):
     @classmethod
     def to_json(cls):
         """
-        Convert the `all` attribute to a JSON string.
+        Convert the `all` attribute to a JSON string, grouped by field name.
+
+        Uses orjson when it is installed, otherwise the standard library json with the same layout.
 
         Returns:
             str: A JSON string representing all logged validation errors.
         """
-        return json.dumps(cls.get_errors().copy(), indent=4)
+        errors = cls.get_errors().copy()
+        if orjson is not None:
+            return orjson.dumps(errors, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(errors, indent=2, ensure_ascii=False)
 
 
 
@@ -73,9 +109,14 @@ class TypeChecker:
         min_value (Optional[float]): Minimum value for numeric attributes.
         max_value (Optional[float]): Maximum value for numeric attributes.
         required (bool): Whether the attribute is mandatory.
-        values (dict): Stores validated values with weak references to their owning instances.
+        values (dict): Stores validated values, keyed by the id of their owning instances,
+                       for instances whose class has no `__dict__` (e.g. uses `__slots__`).
         
     """
+    __slots__ = ('type', 'min_length', 'max_length', 'min_value', 'max_value', 'required',
+                 'log_missing_mandatory_values', 'acceptable_date_formats', 'enum_list',
+                 'values', '_refs', '_kwargs', 'attr_name', '_storage', '_msg_mandatory',
+                 '_use_instance_dict', '_slot', '_validator')
 
     def __init__(self, type_, min_length=None, max_length=None,
                  min_value=float('-inf'), max_value=float('inf'),
@@ -91,7 +132,7 @@ class TypeChecker:
             min_value (Optional[float]): Minimum allowed value for numeric attributes.
             max_value (Optional[float]): Maximum allowed value for numeric attributes.
             required (bool): Whether the attribute is mandatory.
-            acceptable_formats (list(str)): The acceptable format for dates
+            acceptable_date_formats (list(str)): The acceptable formats for dates
             
         """
         self.type = type_
@@ -101,14 +142,43 @@ class TypeChecker:
         self.max_value = max_value
         self.required = required
         self.log_missing_mandatory_values = True
-        self.acceptable_date_formats = None
+        self.acceptable_date_formats = acceptable_date_formats
         self.enum_list = enum_list
         self.values = {}
+        self._refs = {}
+        # the constraints do not change after construction, so the keyword arguments are built once
+        self._kwargs = {
+                        'min_value': min_value,
+                        'max_value': max_value,
+                        'min_length': min_length,
+                        'max_length': max_length,
+                        'acceptable_formats': acceptable_date_formats,
+                        'enum_list': enum_list
+                        }
         
 
     def __set_name__(self, owner_class, attr_name):
-        """Assigns the attribute name to the descriptor."""
+        """
+        Assigns the attribute name to the descriptor and selects the storage for the values.
+
+        Owners that declare a `_tc_values` slot keep the values of all their descriptors in one list
+        per instance, each descriptor at the index given in the order of declaration. Otherwise,
+        instances with a `__dict__` keep the value under a private key of their own `__dict__`.
+        Either way the value is released together with the instance. Remaining slotted instances
+        fall back to `values`.
+        """
         self.attr_name = attr_name
+        self._storage = '_tc_' + attr_name
+        self._msg_mandatory = f'Field {attr_name} is mandatory. Ensure there are no missing values'
+        if isinstance(getattr(owner_class, '_tc_values', None), MemberDescriptorType):
+            # inherited counts keep the indices of subclasses after the ones of their bases
+            self._slot = getattr(owner_class, '_tc_count', 0)
+            owner_class._tc_count = self._slot + 1
+        else:
+            self._slot = None
+        self._use_instance_dict = self._slot is None and owner_class.__dictoffset__ != 0
+        # type and constraints are fixed, so build a validator with them baked in instead of dispatching on every set
+        self._validator = specialize(self.type, attr_name, **self._kwargs)
 
     def __get__(self, instance, owner_class):
         """
@@ -123,8 +193,14 @@ class TypeChecker:
         """
         if instance is None:
             return self
-        tuple_value = self.values.get(id(instance), None)
-        return tuple_value[1] if tuple_value else None
+        if self._use_instance_dict:
+            return instance.__dict__.get(self._storage)
+        if self._slot is not None:
+            try:
+                return instance._tc_values[self._slot]
+            except AttributeError:  # no value set yet
+                return None
+        return self.values.get(id(instance))
 
     def __set__(self, instance, value):
         """
@@ -137,42 +213,96 @@ class TypeChecker:
         """
         # Case 1: Missing mandatory value
         if value is None and self.required:
-            if self.log_missing_mandatory_values:
-                self.log_missing_mandatory_values = False
-                error = ValidationError(self.attr_name ,f'Field {self.attr_name} is mandatory. Ensure there are no missing values')
-                ValidationError.all[self.attr_name].append(error)
-            self.values[id(instance)] = weakref.ref(instance, self._finalise_object), value
-            return
-
-        # Case 2: Mandatory and non-missing value or optional
-        is_ok, error = validate(
-                                self.type,
-                                value,
-                                self.attr_name,
-                                min_value=self.min_value,
-                                max_value =self.max_value,
-                                min_length=self.min_length,
-                                max_length=self.max_length,
-                                acceptable_formats = self.acceptable_date_formats,
-                                enum_list = self.enum_list
-                                )
-
-        # Case 3: Log error if validation fails
-        if not is_ok:
-            ValidationError.all[self.attr_name].append(error)
+            self._log_missing_value()
+        else:
+            # Case 2: Mandatory and non-missing value or optional
+            is_ok, error = self._validator(value)
+
+            # Case 3: Log error if validation fails
+            if not is_ok:
+                ValidationError.all.append((self.attr_name, error))
 
         # store the value even when an error occured
-        self.values[id(instance)] = weakref.ref(instance, self._finalise_object), value
+        if self._use_instance_dict:
+            instance.__dict__[self._storage] = value
+        elif self._slot is not None:
+            try:
+                instance._tc_values[self._slot] = value
+            except AttributeError:  # first value set on the instance
+                instance._tc_values = [None] * type(instance)._tc_count
+                instance._tc_values[self._slot] = value
+        else:
+            key = id(instance)
+            self.values[key] = value
+            # one weakref per instance is enough, reassignments keep the existing one
+            if key not in self._refs:
+                self._refs[key] = weakref.ref(instance, self._make_finaliser(key))
+
+    def validate_column(self, column):
+        """
+        Validates a whole column of values at once and logs an error for every invalid value.
 
-    
-       
+        Typed NumPy arrays (numeric or string) are checked with vectorized NumPy operations, only the
+        values that fail are passed through the validator of the descriptor to build their errors.
+        Any other sequence keeps its values as they are (object array) and is checked value by value,
+        exactly as assigning them would. NaN marks a missing value in a column, just like None.
+
+        Args:
+            column (array_like): One-dimensional sequence of values.
+
+        Returns:
+            numpy.ndarray: A boolean mask, True where the value is valid.
+        """
+        if np is None:
+            raise ImportError("numpy is required for column validation. Install it with 'pip install numpy'")
+        if not isinstance(column, np.ndarray):
+            # np.asarray would coerce mixed values to a common type (e.g. 5 -> '5')
+            column = np.fromiter(column, dtype=object)
+        if column.ndim != 1:
+            raise ValueError('column must be a one-dimensional array')
+        mask = column_mask(self.type, column, self._validator, **self._kwargs)
+        if self.required and column.dtype.kind == 'O':
+            mask &= np.not_equal(column, None)
+
+        # cold path: build the errors of the failed values only
+        for index in np.flatnonzero(~mask):
+            mask[index] = self._validate_rejected(column[index])
+        return mask
+
+    def _validate_rejected(self, value):
+        """
+        Re-validates a value rejected by a vectorized check and logs its error.
+
+        None and NaN are missing values: an error for mandatory fields, valid otherwise.
+
+        Returns:
+            bool: Whether the value is valid.
+        """
+        if value is None or (isinstance(value, Real) and value != value):
+            if self.required:
+                self._log_missing_value()
+                return False
+            return True
+        is_ok, error = self._validator(value)
+        if not is_ok:
+            ValidationError.all.append((self.attr_name, error))
+        return is_ok
+
+    def _log_missing_value(self):
+        """Logs the missing mandatory value error, once per descriptor."""
+        if self.log_missing_mandatory_values:
+            self.log_missing_mandatory_values = False
+            ValidationError.all.append((self.attr_name, self._msg_mandatory))
+
+    def _make_finaliser(self, key):
+        """Builds the callback that drops the value of an instance when it is garbage collected."""
+        values, refs = self.values, self._refs
+
+        def finalise(instance_weakref):
+            values.pop(key, None)
+            refs.pop(key, None)
+        return finalise
 
-    def _finalise_object(self, instance_weakref):
-        """Removes the weak reference to the instance when it is garbage collected(no more strong references to the object)."""
-        reverse_lookup = [key for key, value in self.values.items()
-                          if value[0] == instance_weakref]
-        key = reverse_lookup[0]
-        del self.values[key]
 
 
 @Dispatcher
@@ -197,44 +327,42 @@ def validate(type_, value, attr_name, *, min_length, max_length, min_value, max_
     raise KeyError(f"No validation function registered for type {type_}. Please register one to handle this type.")
 
 
+# The built-in validation functions delegate to the validator builders below, which hold the only
+# implementation of each check. The builders are cached by their constraints, so repeated calls with
+# the same constraints reuse the built validator. Descriptors call it directly through `specialize`.
+
 @validate.register(str)
 def validate_string(type_, value, attr_name, *, min_length, max_length, **kwargs):
-    if value is None:
-        return True, ""
-    if not isinstance(value, str):
-        return False, ValidationError(attr_name, f'Field {attr_name} is type of str. Invalid value: {value}')
-    if min_length and len(value) < min_length:
-        return False, ValidationError(attr_name, f"Field {attr_name} must have at least {min_length} characters. Invalid value: {value}")
-    if max_length and len(value) > max_length:
-        return False, ValidationError(attr_name, f"Field {attr_name} cannot have more than {max_length} characters. Invalid value: {value}")
-    return True, ""
+    return _string_validator(attr_name, min_length, max_length)(value)
 
 @validate.register(int)
 def validate_integer(type_, value, attr_name, *, min_value, max_value, **kwargs):
-    if value is None:
-        return True, ""
-    if not isinstance(value, Real) or float(value) != int(value):
-        return False, ValidationError(attr_name, f"{attr_name} is type of integer. Invalid value: {value}")
-    if not (min_value < value < max_value):
-        return False, ValidationError(attr_name, f"{attr_name} must be between {min_value} and {max_value}. Bottom and upper bounds inclusive")
-    return True, ""
+    return _integer_validator(attr_name, min_value, max_value)(value)
 
 @validate.register(float)
 def validate_float(type_, value, attr_name, *, min_value=None, max_value=None, max_length=None, **kwargs):
-   
-    if value is None:
-        return True, ""
-    if not isinstance(value, Real):
-        return False, ValidationError(attr_name, f"{attr_name} must be a float. Invalid value: {value}")
-    if not (min_value < value < max_value):
-       return False, ValidationError(attr_name, f"{attr_name} must be between {min_value} and {max_value}."
-                                                f" Bottom and upper bounds inclusive. Invalid value: {value}")
-    if max_length is not None:
-        # Split the float into its integer and decimal parts
-        parts = str(value).split(".")
-        if len(parts) > 1 and len(parts[1]) > max_length:
-            return False, ValidationError(attr_name, f"{attr_name} must have at most {max_length} decimal places. Invalid value: {value}")
-    return True, ""
+    return _float_validator(attr_name, min_value, max_value, max_length)(value)
+
+def _parse_default_date(value):
+    """
+    Parse a date string in one of the default formats ('%Y%m%d', '%Y-%m-%d') without strptime.
+
+    Returns:
+        date or None: The parsed date, or None if the value is not a valid date in these formats.
+    """
+    if len(value) == 8:
+        year, month, day = value[:4], value[4:6], value[6:]
+    elif len(value) == 10 and value[4] == '-' and value[7] == '-':
+        year, month, day = value[:4], value[5:7], value[8:]
+    else:
+        return None
+    digits = year + month + day
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
 
 @validate.register(date)
 def validate_date(type_, value, attr_name, *, acceptable_formats=None, **kwargs):
@@ -248,14 +376,18 @@ def validate_date(type_, value, attr_name, *, acceptable_formats=None, **kwargs)
         acceptable_formats: A list of acceptable date formats (default: ['%Y%m%d', '%Y-%m-%d']).
     
     Returns:
-        Tuple (bool, str or ValidationError): Validation status and message or error object.
+        Tuple (bool, str): Validation status and error message.
     """
     if value is None or isinstance(value, (date, datetime)):
         return True, ""
     if acceptable_formats is None:
+        # the default formats are parsed by hand, strptime only runs for the values that fail
+        if isinstance(value, str) and _parse_default_date(value) is not None:
+            return True, ""
         acceptable_formats = ['%Y%m%d', '%Y-%m-%d']
     
-    for fmt in acceptable_formats:
+    # strptime only accepts strings, any other value is invalid
+    for fmt in (acceptable_formats if isinstance(value, str) else ()):
         try:
             # Try parsing the value with each format
             datetime.strptime(value, fmt)
@@ -264,23 +396,344 @@ def validate_date(type_, value, attr_name, *, acceptable_formats=None, **kwargs)
             continue
     
     # If no formats match, return a validation error
-    return False, ValidationError(attr_name, f"{attr_name} must match one of the formats: {', '.join(acceptable_formats)}. Invalid value: {value}")
+    return False, f"{attr_name} must match one of the formats: {', '.join(acceptable_formats)}. Invalid value: {value}"
 
 @validate.register('enum')
 def validate_enum(type_,value, attr_name, enum_list, **kwargs):
-    if value is None:
+    container = type(enum_list)
+    if container is list or container is tuple:
+        try:
+            validator = _cached_enum_validator(attr_name, container, tuple(enum_list))
+        except TypeError:  # unhashable members
+            validator = _enum_validator(attr_name, enum_list)
+    else:
+        validator = _enum_validator(attr_name, enum_list)
+    return validator(value)
+
+
+@Dispatcher
+def specialize(type_, attr_name, **constraints):
+    """
+    Builds a validator of a single value with the constraints of a descriptor baked in.
+
+    Types without a registered specialization, or whose built-in `validate` function was replaced
+    by a custom one, fall back to their `validate` function.
+
+    Args:
+        type_ (type): Expected type of the value.
+        attr_name (str): The attribute name being validated.
+        **constraints: The constraints forwarded to `validate`.
+
+    Returns:
+        Callable: A function taking the value and returning a tuple (bool, str).
+    """
+    validator = validate.get_function(type_)
+
+    def validate_value(value):
+        return validator(type_, value, attr_name, **constraints)
+    return validate_value
+
+
+@specialize.register(str)
+def specialize_string(type_, attr_name, *, min_length, max_length, **kwargs):
+    if validate.get_function(type_) is not validate_string:  # a custom validation function is registered
+        return specialize.default_function(type_, attr_name, min_length=min_length, max_length=max_length, **kwargs)
+    return _string_validator(attr_name, min_length, max_length)
+
+@specialize.register(int)
+def specialize_integer(type_, attr_name, *, min_value, max_value, **kwargs):
+    if validate.get_function(type_) is not validate_integer:  # a custom validation function is registered
+        return specialize.default_function(type_, attr_name, min_value=min_value, max_value=max_value, **kwargs)
+    return _integer_validator(attr_name, min_value, max_value)
+
+@specialize.register(float)
+def specialize_float(type_, attr_name, *, min_value=None, max_value=None, max_length=None, **kwargs):
+    if validate.get_function(type_) is not validate_float:  # a custom validation function is registered
+        return specialize.default_function(type_, attr_name, min_value=min_value, max_value=max_value,
+                                           max_length=max_length, **kwargs)
+    return _float_validator(attr_name, min_value, max_value, max_length)
+
+@specialize.register('enum')
+def specialize_enum(type_, attr_name, *, enum_list, **kwargs):
+    if validate.get_function(type_) is not validate_enum:  # a custom validation function is registered
+        return specialize.default_function(type_, attr_name, enum_list=enum_list, **kwargs)
+    return _enum_validator(attr_name, enum_list)
+
+
+# Validator builders: each returns a function of a single value with the constraints baked in,
+# returning a tuple (bool, str). They are shared by the built-in `validate` functions and `specialize`.
+
+@lru_cache(maxsize=256, typed=True)
+def _string_validator(attr_name, min_length, max_length):
+    # one variant per combination of length constraints, the bounds are bound as default arguments (fast locals)
+    # the messages are built once, a failure only appends the invalid value
+    type_message = f'Field {attr_name} is type of str. Invalid value: '
+    min_length_message = f"Field {attr_name} must have at least {min_length} characters. Invalid value: "
+    max_length_message = f"Field {attr_name} cannot have more than {max_length} characters. Invalid value: "
+
+    if min_length and max_length:
+        def validate_value(value, min_length=min_length, max_length=max_length):
+            if value is None:
+                return True, ""
+            if type(value) is not str and not isinstance(value, str):
+                return False, f'{type_message}{value}'
+            if len(value) < min_length:
+                return False, f'{min_length_message}{value}'
+            if len(value) > max_length:
+                return False, f'{max_length_message}{value}'
+            return True, ""
+    elif min_length:
+        def validate_value(value, min_length=min_length):
+            if value is None:
+                return True, ""
+            if type(value) is not str and not isinstance(value, str):
+                return False, f'{type_message}{value}'
+            if len(value) < min_length:
+                return False, f'{min_length_message}{value}'
+            return True, ""
+    elif max_length:
+        def validate_value(value, max_length=max_length):
+            if value is None:
+                return True, ""
+            if type(value) is not str and not isinstance(value, str):
+                return False, f'{type_message}{value}'
+            if len(value) > max_length:
+                return False, f'{max_length_message}{value}'
+            return True, ""
+    else:
+        def validate_value(value):
+            if value is None or type(value) is str or isinstance(value, str):
+                return True, ""
+            return False, f'{type_message}{value}'
+    return validate_value
+
+@lru_cache(maxsize=256, typed=True)
+def _integer_validator(attr_name, min_value, max_value):
+    type_message = f"{attr_name} is type of integer. Invalid value: "
+    range_message = f"{attr_name} must be between {min_value} and {max_value}. Bottom and upper bounds inclusive"
+
+    def validate_value(value, min_value=min_value, max_value=max_value):
+        if value is None:
+            return True, ""
+        # non-finite floats (nan, inf) cannot be converted to int and are never integers
+        if type(value) is not int and (not isinstance(value, Real) or not isfinite(value)
+                                       or float(value) != int(value)):
+            return False, f'{type_message}{value}'
+        if not (min_value <= value <= max_value):
+            return False, range_message
+        return True, ""
+    return validate_value
+
+@lru_cache(maxsize=256, typed=True)
+def _float_validator(attr_name, min_value, max_value, max_length):
+    type_message = f"{attr_name} must be a float. Invalid value: "
+    range_message = f"{attr_name} must be between {min_value} and {max_value}. Bottom and upper bounds inclusive. Invalid value: "
+    decimals_message = f"{attr_name} must have at most {max_length} decimal places. Invalid value: "
+
+    if max_length is None:
+        def validate_value(value, min_value=min_value, max_value=max_value):
+            if value is None:
+                return True, ""
+            if type(value) is not float and not isinstance(value, Real):
+                return False, f'{type_message}{value}'
+            if not (min_value <= value <= max_value):
+                return False, f'{range_message}{value}'
+            return True, ""
+        return validate_value
+
+    def validate_value(value, min_value=min_value, max_value=max_value, max_length=max_length):
+        if value is None:
+            return True, ""
+        if type(value) is not float and not isinstance(value, Real):
+            return False, f'{type_message}{value}'
+        if not (min_value <= value <= max_value):
+            return False, f'{range_message}{value}'
+        text = str(value)
+        point = text.find(".")
+        if point != -1 and len(text) - point - 1 > max_length:
+            return False, f'{decimals_message}{value}'
         return True, ""
+    return validate_value
+
+def _enum_validator(attr_name, enum_list):
     if enum_list is None:
-        raise ValueError('Enum list can not be empty. Provide the acceptable values for attribute {attr_name}')
-    if value not in enum_list:
-        return False, ValidationError(attr_name, f"Acceptable values for attribute {attr_name} are {enum_list}. Invalid value: {value}")
-    
-    return True, ""
+        def validate_value(value):
+            if value is None:
+                return True, ""
+            raise ValueError(f'Enum list can not be empty. Provide the acceptable values for attribute {attr_name}')
+        return validate_value
+    # hashed membership, the original list is kept for the error message
+    try:
+        members = frozenset(enum_list)
+    except TypeError:  # unhashable members, scan the list
+        members = enum_list
+    message = f"Acceptable values for attribute {attr_name} are {enum_list}. Invalid value: "
+
+    def validate_value(value, members=members):
+        if value is None:
+            return True, ""
+        try:
+            is_member = value in members
+        except TypeError:  # unhashable value
+            is_member = value in enum_list
+        if not is_member:
+            return False, f'{message}{value}'
+        return True, ""
+    return validate_value
+
+@lru_cache(maxsize=256, typed=True)
+def _cached_enum_validator(attr_name, container, members):
+    """Builds the enum validator of a list or tuple of hashable members, keyed by their values."""
+    return _enum_validator(attr_name, container(members))
+
+
+@Dispatcher
+def column_mask(type_, column, validator, **constraints):
+    """
+    Computes which values of a NumPy column are valid.
+
+    The mask may be pessimistic: `TypeChecker.validate_column` re-checks the rejected values one
+    by one. Types without a registered vectorized check apply the validator element-wise.
+
+    Args:
+        type_ (type): Expected type of the values.
+        column (numpy.ndarray): One-dimensional array of values.
+        validator (Callable): The specialized validator of a single value.
+        **constraints: The constraints of the descriptor.
+
+    Returns:
+        numpy.ndarray: A boolean mask, True where the value is valid.
+    """
+    return np.fromiter((validator(value)[0] for value in column), dtype=bool, count=len(column))
+
+
+@column_mask.register(str)
+def column_mask_string(type_, column, validator, *, min_length, max_length, **kwargs):
+    if column.dtype.kind != 'U':
+        return column_mask.default_function(type_, column, validator)
+    mask = np.ones(len(column), dtype=bool)
+    if min_length or max_length:
+        lengths = np.char.str_len(column)
+        if min_length:
+            mask &= lengths >= min_length
+        if max_length:
+            mask &= lengths <= max_length
+    return mask
+
+@column_mask.register(int)
+def column_mask_integer(type_, column, validator, *, min_value, max_value, **kwargs):
+    if column.dtype.kind not in 'biuf':
+        return column_mask.default_function(type_, column, validator)
+    mask = (column >= min_value) & (column <= max_value)
+    if column.dtype.kind == 'f':
+        # inf equals its floor but, like nan, is not an integer
+        mask &= np.isfinite(column) & (column == np.floor(column))
+    return mask
+
+@column_mask.register(float)
+def column_mask_float(type_, column, validator, *, min_value, max_value, max_length=None, **kwargs):
+    if column.dtype.kind not in 'biuf':
+        return column_mask.default_function(type_, column, validator)
+    mask = (column >= min_value) & (column <= max_value)
+    if max_length is not None:
+        # the decimal places have no vectorized equivalent, check the values inside the range only
+        in_range = np.flatnonzero(mask)
+        mask[in_range] = np.fromiter((validator(value)[0] for value in column[in_range]), dtype=bool, count=len(in_range))
+    return mask
+
+@column_mask.register('enum')
+def column_mask_enum(type_, column, validator, *, enum_list, **kwargs):
+    # np.isin compares after coercing to a common type (e.g. 1 == '1'), so it only runs when the
+    # members already have the type of the column
+    if column.dtype.kind == 'U':
+        comparable = enum_list is not None and all(isinstance(member, str) for member in enum_list)
+    elif column.dtype.kind in 'biuf':
+        comparable = enum_list is not None and all(isinstance(member, Real) for member in enum_list)
+    else:
+        comparable = False
+    if not comparable:
+        return column_mask.default_function(type_, column, validator)
+    return np.isin(column, list(enum_list))
+
+
+def _check_numeric_records(records, columns, integral, lower, upper):
+    """
+    Check the numeric columns of the records row by row.
+
+    Returns:
+        numpy.ndarray: One status code per row and checked column: 0 valid, 1 not integral (including
+        nan and inf), 2 out of range.
+    """
+    codes = np.zeros((records.shape[0], columns.shape[0]), dtype=np.int8)
+    for row in prange(records.shape[0]):
+        for k in range(columns.shape[0]):
+            value = records[row, columns[k]]
+            if integral[k] and (not np.isfinite(value) or value != np.floor(value)):
+                codes[row, k] = 1
+            elif not (lower[k] <= value <= upper[k]):
+                codes[row, k] = 2
+    return codes
+
+if njit is not None:
+    _check_numeric_records = njit(parallel=True, cache=True)(_check_numeric_records)
+
+
+def validate_batch(records, checkers):
+    """
+    Validates a two-dimensional array of records and logs an error for every invalid value.
+
+    When numba is installed, the int and float columns of a float array are checked in a single
+    compiled loop over the rows, running in parallel. Every other column goes through
+    `TypeChecker.validate_column`. Only the values that fail are passed through the validator of
+    their descriptor to build their errors. Records that are not a NumPy array (e.g. a list of
+    Person-like rows) keep their values as they are, so each column is checked as assignment would.
+    NaN marks a missing value, just like None.
+
+    Args:
+        records (array_like): Two-dimensional array with one row per record.
+        checkers (Sequence[TypeChecker]): The descriptor of each column, or None to skip the column.
+
+    Returns:
+        numpy.ndarray: A boolean mask with the shape of records, True where the value is valid.
+    """
+    if np is None:
+        raise ImportError("numpy is required for batch validation. Install it with 'pip install numpy'")
+    if not isinstance(records, np.ndarray):
+        # np.asarray would coerce mixed rows to a common type (e.g. 24 -> '24')
+        records = np.asarray(records, dtype=object)
+    if records.ndim != 2 or records.shape[1] != len(checkers):
+        raise ValueError('records must be a two-dimensional array with one column per checker')
+
+    mask = np.ones(records.shape, dtype=bool)
+    compiled = []
+    for column, checker in enumerate(checkers):
+        if checker is None:
+            continue
+        # the compiled loop compares in float64: integer arrays would lose precision above 2**53 and the
+        # decimal places of floats have no compiled check, so both go through validate_column
+        if (njit is not None and records.dtype.kind == 'f'
+                and (checker.type is int or (checker.type is float and checker.max_length is None))):
+            compiled.append(column)
+        else:
+            mask[:, column] = checker.validate_column(records[:, column])
+
+    if compiled:
+        codes = _check_numeric_records(records,
+                                       np.array(compiled, dtype=np.int64),
+                                       np.array([checkers[column].type is int for column in compiled]),
+                                       np.array([checkers[column].min_value for column in compiled], dtype=np.float64),
+                                       np.array([checkers[column].max_value for column in compiled], dtype=np.float64))
+
+        # cold path: build the errors of the failed values only
+        for row, k in zip(*np.nonzero(codes)):
+            column = compiled[k]
+            mask[row, column] = checkers[column]._validate_rejected(records[row, column])
+    return mask
 
 
 if __name__ == '__main__':
     class Person:
-        __slots__ = '__weakref__'
+        __slots__ = ('__weakref__', '_tc_values')
 
         first_name = TypeChecker(str, min_length=1, max_length=6, required=True)
         last_name = TypeChecker(str, min_length=3, max_length=4, required=True)
@@ -306,4 +759,15 @@ if __name__ == '__main__':
 
 
     for key, value in ValidationError.get_errors().items():
-        print(key, value, end='\n'*2)
\ No newline at end of file
+        print(key, value, end='\n'*2)
+    # Bulk validation of rows and numeric arrays, without creating instances (requires numpy)
+    if np is not None:
+        ValidationError.clear_errors()
+        rows = [['Joe', 'Boo', '20000101', 24, 1000.5, 'red'],
+                ['Alexander', 'Rose', '2000/01/01', float('nan'), 20.0, 'rose']] # long first name, wrong date, missing age, wrong eye's color
+        print(validate_batch(rows, [Person.first_name, Person.last_name, Person.dob,
+                                    Person.age, Person.salary, Person.eye_color]), end='\n'*2)
+        print(validate_batch(np.array([[24, 1000.5], [101, 20.123]]), [Person.age, Person.salary]), end='\n'*2) # age is outlier, wrong precision in salary
+
+        for key, value in ValidationError.get_errors().items():
+            print(key, value, end='\n'*2)
@@ -0,0 +1,299 @@
+# test_descriptors.py
+import gc
+import unittest
+from datetime import date, datetime
+
+from descriptors import TypeChecker, ValidationError, validate, validate_batch, np, njit, _parse_default_date
+
+
+def make_person():
+    """Build a fresh owner class, the descriptors keep per-descriptor logging state."""
+    class Person:
+        name = TypeChecker(str, max_length=5)
+        age = TypeChecker(int, min_value=0, max_value=100, required=True)
+        salary = TypeChecker(float, min_value=0, max_value=100_000)
+        eye_color = TypeChecker('enum', enum_list=[1, 'a'])
+        dob = TypeChecker(date)
+    return Person
+
+
+class TestInstanceDictStorage(unittest.TestCase):
+
+    def test_value_is_stored_in_instance_dict(self):
+        person = make_person()()
+        self.assertIsNone(person.name)
+        person.name = 'Joe'
+        self.assertEqual(person.name, 'Joe')
+        self.assertEqual(person.__dict__, {'_tc_name': 'Joe'})
+        self.assertEqual(type(person).name.values, {})
+
+
+class TestSlottedStorage(unittest.TestCase):
+
+    def setUp(self):
+        class Slotted:
+            __slots__ = ('__weakref__',)
+            age = TypeChecker(int, min_value=0, max_value=100)
+        self.Slotted = Slotted
+
+    def test_values_are_released_with_the_instance(self):
+        first, second = self.Slotted(), self.Slotted()
+        first.age, second.age = 1, 2
+        first.age = 3
+        self.assertEqual((first.age, second.age), (3, 2))
+        self.assertEqual(len(self.Slotted.age.values), 2)
+        self.assertEqual(len(self.Slotted.age._refs), 2)
+
+        del first, second
+        gc.collect()
+        self.assertEqual(self.Slotted.age.values, {})
+        self.assertEqual(self.Slotted.age._refs, {})
+
+
+class TestValuesListStorage(unittest.TestCase):
+
+    def setUp(self):
+        class Base:
+            __slots__ = ('_tc_values',)
+            name = TypeChecker(str)
+            age = TypeChecker(int)
+
+        class Derived(Base):
+            __slots__ = ()
+            salary = TypeChecker(float)
+        self.Base, self.Derived = Base, Derived
+
+    def test_descriptor_indices(self):
+        self.assertEqual((self.Base.name._slot, self.Base.age._slot, self.Derived.salary._slot), (0, 1, 2))
+        self.assertEqual((self.Base._tc_count, self.Derived._tc_count), (2, 3))
+
+    def test_list_is_allocated_on_first_set(self):
+        derived = self.Derived()
+        self.assertIsNone(derived.salary)
+        self.assertFalse(hasattr(derived, '_tc_values'))
+        derived.salary = 10.0
+        self.assertEqual(derived._tc_values, [None, None, 10.0])
+        self.assertEqual(self.Derived.salary.values, {})
+
+    def test_base_and_derived_instances_do_not_interfere(self):
+        base, derived = self.Base(), self.Derived()
+        base.name, base.age = 'Joe', 1
+        derived.name, derived.age, derived.salary = 'Ann', 2, 3.0
+        self.assertEqual(base._tc_values, ['Joe', 1])
+        self.assertEqual(derived._tc_values, ['Ann', 2, 3.0])
+        self.assertEqual((base.name, base.age), ('Joe', 1))
+        self.assertEqual((derived.name, derived.age, derived.salary), ('Ann', 2, 3.0))
+
+
+class TestCustomValidator(unittest.TestCase):
+
+    def setUp(self):
+        ValidationError.clear_errors()
+        self.registered = validate.get_function(str)
+
+    def tearDown(self):
+        validate.register(str)(self.registered)
+        ValidationError.clear_errors()
+
+    def test_registered_validator_is_used_by_descriptor(self):
+        @validate.register(str)
+        def custom(type_, value, attr_name, **kwargs):
+            return False, f'custom {value}'
+
+        make_person()().name = 'Joe'
+        self.assertEqual(ValidationError.all, [('name', 'custom Joe')])
+
+
+class TestGenericValidate(unittest.TestCase):
+    constraints = dict(min_length=None, max_length=None, acceptable_formats=None, enum_list=None)
+
+    def test_cached_validators_keep_bound_types_apart(self):
+        self.assertEqual(validate(int, 20, 'age', min_value=0, max_value=10, **self.constraints),
+                         (False, 'age must be between 0 and 10. Bottom and upper bounds inclusive'))
+        self.assertEqual(validate(int, 20, 'age', min_value=0.0, max_value=10, **self.constraints),
+                         (False, 'age must be between 0.0 and 10. Bottom and upper bounds inclusive'))
+
+    def test_enum_members(self):
+        constraints = dict(self.constraints, min_value=None, max_value=None)
+        for enum_list in (['a', 'b'], ('a', 'b'), {'a', 'b'}):
+            self.assertEqual(validate('enum', 'a', 'eye_color', **dict(constraints, enum_list=enum_list)), (True, ''))
+        self.assertEqual(validate('enum', 'c', 'eye_color', **dict(constraints, enum_list=('a', 'b'))),
+                         (False, "Acceptable values for attribute eye_color are ('a', 'b'). Invalid value: c"))
+
+
+class TestDefaultDateParser(unittest.TestCase):
+    constraints = dict(min_length=None, max_length=None, min_value=None, max_value=None)
+
+    @staticmethod
+    def strptime_accepts(value):
+        for fmt in ('%Y%m%d', '%Y-%m-%d'):
+            try:
+                datetime.strptime(value, fmt)
+                return True
+            except ValueError:
+                continue
+        return False
+
+    def test_valid_dates(self):
+        for value in ('20000101', '2000-01-01', '20000229', '1999-12-31'):
+            self.assertEqual(_parse_default_date(value), datetime.strptime(value.replace('-', ''), '%Y%m%d').date())
+
+    def test_rejected_by_fast_parser(self):
+        # invalid month or day, wrong separators and non-ASCII digits (the latter still reach strptime)
+        for value in ('20001301', '2000-02-30', '19000229', '00000101', '2000/01/01', '２０００0101', '2000 101'):
+            self.assertIsNone(_parse_default_date(value))
+
+    def test_same_result_as_strptime(self):
+        for value in ('20000101', '2000-01-01', '20001301', '2000-02-30', '２０００0101', '2000-1-1', '2000111', 'x'):
+            is_ok, _ = validate(date, value, 'dob', **self.constraints)
+            self.assertEqual(is_ok, self.strptime_accepts(value), value)
+
+    def test_strptime_fallback(self):
+        # rejected by the fast parser, accepted by strptime
+        self.assertIsNone(_parse_default_date('2000-1-1'))
+        self.assertEqual(validate(date, '2000-1-1', 'dob', **self.constraints), (True, ''))
+
+
+class TestInclusiveBounds(unittest.TestCase):
+
+    def setUp(self):
+        ValidationError.clear_errors()
+
+        class Reading:
+            count = TypeChecker(int, min_value=0, max_value=10)
+            level = TypeChecker(float, min_value=-1.5, max_value=2.5)
+        self.Reading = Reading
+
+    def test_bounds_on_assignment(self):
+        reading = self.Reading()
+        for count, level in ((0, -1.5), (10, 2.5)):
+            reading.count, reading.level = count, level
+        self.assertEqual(ValidationError.all, [])
+
+        reading.count, reading.level = 11, 2.51
+        reading.count, reading.level = -1, -1.51
+        self.assertEqual([field_name for field_name, message in ValidationError.all],
+                         ['count', 'level', 'count', 'level'])
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_bounds_on_validate_column(self):
+        self.assertEqual(self.Reading.count.validate_column(np.array([-1, 0, 10, 11])).tolist(),
+                         [False, True, True, False])
+        self.assertEqual(self.Reading.level.validate_column(np.array([-1.51, -1.5, 2.5, 2.51])).tolist(),
+                         [False, True, True, False])
+        self.assertEqual(len(ValidationError.all), 4)
+
+
+class TestEnum(unittest.TestCase):
+
+    def test_unhashable_members(self):
+        class Record:
+            tags = TypeChecker('enum', enum_list=[['a'], 'b'])
+        self.assertEqual(Record.tags._validator(['a']), (True, ''))
+        self.assertEqual(Record.tags._validator('b'), (True, ''))
+        self.assertFalse(Record.tags._validator('a')[0])
+
+
+class TestNonFiniteValues(unittest.TestCase):
+
+    def setUp(self):
+        ValidationError.clear_errors()
+
+    def test_integer_rejects_nan_and_inf(self):
+        person = make_person()()
+        person.age = float('nan')
+        person.age = float('inf')
+        self.assertEqual(ValidationError.all, [('age', 'age is type of integer. Invalid value: nan'),
+                                               ('age', 'age is type of integer. Invalid value: inf')])
+
+    def test_date_rejects_non_string(self):
+        make_person()().dob = 20000101
+        self.assertEqual(len(ValidationError.all), 1)
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestValidateColumn(unittest.TestCase):
+
+    def setUp(self):
+        ValidationError.clear_errors()
+        self.Person = make_person()
+
+    def test_mixed_sequence_is_not_coerced(self):
+        mask = self.Person.name.validate_column(['abc', 5])
+        self.assertEqual(mask.tolist(), [True, False])
+        self.assertEqual(ValidationError.all, [('name', 'Field name is type of str. Invalid value: 5')])
+
+    def test_enum_does_not_match_coerced_values(self):
+        mask = self.Person.eye_color.validate_column(['1', 'a', 1])
+        self.assertEqual(mask.tolist(), [False, True, True])
+        mask = self.Person.eye_color.validate_column(np.array(['1', 'a']))
+        self.assertEqual(mask.tolist(), [False, True])
+
+    def test_nan_in_integer_column(self):
+        mask = self.Person.age.validate_column(np.array([1.0, np.nan, np.inf, 3.0]))
+        self.assertEqual(mask.tolist(), [True, False, False, True])
+        self.assertEqual(ValidationError.all,
+                         [('age', 'Field age is mandatory. Ensure there are no missing values'),
+                          ('age', 'age is type of integer. Invalid value: inf')])
+
+    def test_rejects_multidimensional_column(self):
+        with self.assertRaises(ValueError):
+            self.Person.age.validate_column(np.array([[1, 20], [3, 4]]))
+
+    def test_inf_in_integer_column_with_default_bounds(self):
+        class Record:
+            count = TypeChecker(int)
+        mask = Record.count.validate_column(np.array([np.inf, -np.inf, 2.0]))
+        self.assertEqual(mask.tolist(), [False, False, True])
+        self.assertEqual(len(ValidationError.all), 2)
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestValidateBatch(unittest.TestCase):
+
+    def setUp(self):
+        ValidationError.clear_errors()
+        self.Person = make_person()
+        self.checkers = [self.Person.salary, self.Person.age]
+
+    def test_mixed_rows(self):
+        Person = self.Person
+        mask = validate_batch([['Joe', 24, 1000.5], ['Alexander', 101, 20.0]],
+                              [Person.name, Person.age, Person.salary])
+        self.assertEqual(mask.tolist(), [[True, True, True], [False, False, True]])
+        self.assertEqual(sorted(field_name for field_name, message in ValidationError.all), ['age', 'name'])
+
+    def test_nan_rows(self):
+        mask = validate_batch(np.array([[1.0, np.nan], [2.0, 5.0], [np.inf, 1.5]]), self.checkers)
+        self.assertEqual(mask.tolist(), [[True, False], [True, True], [False, False]])
+        self.assertEqual(sorted(ValidationError.all),
+                         [('age', 'Field age is mandatory. Ensure there are no missing values'),
+                          ('age', 'age is type of integer. Invalid value: 1.5'),
+                          ('salary', 'salary must be between 0 and 100000. Bottom and upper bounds inclusive. Invalid value: inf')])
+
+    @unittest.skipIf(njit is None, 'numba is not installed')
+    def test_numeric_records_compiled(self):
+        records = np.array([[10.0, 1.0], [-1.0, 50.0], [20.0, 200.0]])
+        mask = validate_batch(records, self.checkers)
+        self.assertEqual(mask.tolist(), [[True, True], [False, True], [True, False]])
+        self.assertEqual(len(ValidationError.all), 2)
+
+    def test_inf_in_integer_column_with_default_bounds(self):
+        class Record:
+            count = TypeChecker(int)
+            amount = TypeChecker(float)
+        mask = validate_batch(np.array([[np.inf, 1.0], [-np.inf, 2.0], [3.0, np.inf]]), [Record.count, Record.amount])
+        self.assertEqual(mask.tolist(), [[False, True], [False, True], [True, True]])
+        self.assertEqual(ValidationError.all, [('count', 'count is type of integer. Invalid value: inf'),
+                                               ('count', 'count is type of integer. Invalid value: -inf')])
+
+    def test_large_integers_are_compared_exactly(self):
+        class Record:
+            count = TypeChecker(int, min_value=0, max_value=2**62)
+        mask = validate_batch(np.array([[2**62], [2**62 + 1]]), [Record.count])
+        self.assertEqual(mask.tolist(), [[True], [False]])
+        self.assertEqual(len(ValidationError.all), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()